@@ -0,0 +1,20 @@
+"""
+Build Script for Audio Processing Kernels
+Compiles the numba speech detection kernel in stt_module once so the on-disk cache is ready before first use
+"""
+
+import time
+from stt_module import compile_kernels
+
+
+def main():
+    """Entry point"""
+    start = time.perf_counter()
+    if compile_kernels():
+        print(f"[KERNELS] Compiled and cached in {time.perf_counter() - start:.1f}s")
+    else:
+        print("[KERNELS] numba is not installed - using NumPy fallbacks")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,26 @@ from dotenv import load_dotenv
 from google.cloud import speech_v1
 from google.oauth2 import service_account
 
-# Load environment variables from .env file
+try:
+    from google.cloud import storage
+except ImportError:
+    storage = None
+
+# Load environment variables from .env file (variables already set in the environment win)
 load_dotenv()
 
+# Speech and storage clients are created on first use, not at import
+_speech_client = None
+_storage_client = None
+
+# Cloud Storage bucket for long recordings (optional): audio over a minute is uploaded
+# here and transcribed with long-running recognition instead of being sent inline
+STT_GCS_BUCKET = os.getenv('GOOGLE_CLOUD_STT_BUCKET')
+
+# Registered PhraseSet resource with the route vocabulary (optional, see create_route_phrase_set):
+# requests reference it by name instead of sending the phrase list every time
+STT_PHRASE_SET = os.getenv('GOOGLE_CLOUD_PHRASE_SET')
+
 # Load Google Cloud credentials from environment variable or file
 def get_google_credentials():
     """Load Google Cloud credentials securely from environment"""
@@ -35,10 +52,28 @@ def get_google_credentials():
 
 
 def get_speech_client():
-    """Initialize and return Google Cloud Speech client with credentials"""
-    creds_dict = get_google_credentials()
-    credentials = service_account.Credentials.from_service_account_info(creds_dict)
-    return speech_v1.SpeechClient(credentials=credentials)
+    """Return the shared Google Cloud Speech client, creating it on first use"""
+    global _speech_client
+    if _speech_client is None:
+        creds_dict = get_google_credentials()
+        credentials = service_account.Credentials.from_service_account_info(creds_dict)
+        _speech_client = speech_v1.SpeechClient(credentials=credentials)
+    return _speech_client
+
+
+def get_storage_client():
+    """Return the shared Google Cloud Storage client, creating it on first use"""
+    global _storage_client
+    if _storage_client is None:
+        if storage is None:
+            raise ImportError(
+                "google-cloud-storage is not installed.\n"
+                "Install it to transcribe long recordings from GOOGLE_CLOUD_STT_BUCKET."
+            )
+        creds_dict = get_google_credentials()
+        credentials = service_account.Credentials.from_service_account_info(creds_dict)
+        _storage_client = storage.Client(project=creds_dict.get('project_id'), credentials=credentials)
+    return _storage_client
 
 
 # STT Configuration optimized for route instructions
@@ -50,3 +85,61 @@ STT_CONFIG = {
     'enable_automatic_punctuation': True,
     'use_enhanced': True,  # Enhanced model for better accuracy with complex text
 }
+
+
+# Route vocabulary hints for Google Cloud STT speech adaptation
+SPEECH_CONTEXT_PHRASES = [
+    # Route numbers - most critical
+    'I-29', 'I-35', 'I-90', 'I-80', 'I-70', 'I-480',
+    'US-75', 'US-59', 'US-18', 'US-69', 'US-20', 'US-30',
+    'IA-9', 'IA-4', 'IA-3', 'IA-27', 'IA-175',
+    'B-62', 'B62', 'A-10', 'A10',
+    # Directional suffixes
+    'NORTHBOUND', 'SOUTHBOUND', 'EASTBOUND', 'WESTBOUND',
+    'NB', 'SB', 'EB', 'WB', 'NORTH', 'SOUTH', 'EAST', 'WEST',
+    # Intersection markers
+    'INTERSECTION', 'AT INTERSECTION', 'MILEPOST', 'MP',
+    'STATE BORDER', 'JUNCTION', 'EXIT', 'MILE MARKER',
+    # Action commands
+    'START ON', 'START AT', 'END ON', 'END AT', 'END UP',
+    'CONTINUE', 'TURN', 'MERGE', 'TAKE',
+    'AT', 'IN', 'NEAR', 'TOWARDS',
+    # City and location names
+    'LYON', 'ROCK RAPIDS', 'SANBORN', 'EMMETSBURG',
+    'HANCOCK', 'SIOUX CITY', 'SPENCER', 'ESTHERVILLE',
+    'CHEROKEE', 'STORM LAKE', 'TOLEDO', 'MAPLETON',
+    'WASHTA', 'DUNLAP', 'DENISON', 'CRAWFORD',
+    # Street names
+    'UNION', 'BROADWAY', 'EASTERN', 'QUAIL',
+    'MAIN STREET', 'FIRST STREET', 'SECOND STREET',
+    # State abbreviations
+    'IOWA', 'SOUTH DAKOTA', 'MINNESOTA', 'WISCONSIN',
+    'IA', 'SD', 'MN', 'WI',
+]
+SPEECH_CONTEXT_BOOST = 15.0  # Strong boost for accurate route matching
+
+
+def create_route_phrase_set(phrase_set_id='route-phrases', location='global'):
+    """
+    Register the route vocabulary as a reusable PhraseSet resource (run once at deploy time)
+    
+    Args:
+        phrase_set_id: ID for the new PhraseSet
+        location: Speech API location
+        
+    Returns:
+        str: Resource name to set as GOOGLE_CLOUD_PHRASE_SET
+    """
+    creds_dict = get_google_credentials()
+    credentials = service_account.Credentials.from_service_account_info(creds_dict)
+    client = speech_v1.AdaptationClient(credentials=credentials)
+    
+    phrase_set = client.create_phrase_set(
+        parent=f"projects/{creds_dict['project_id']}/locations/{location}",
+        phrase_set_id=phrase_set_id,
+        phrase_set=speech_v1.PhraseSet(
+            phrases=[speech_v1.PhraseSet.Phrase(value=phrase) for phrase in SPEECH_CONTEXT_PHRASES],
+            boost=SPEECH_CONTEXT_BOOST
+        )
+    )
+    return phrase_set.name
@@ -4,8 +4,9 @@ Terminal-based testing and development
 """
 
 from stt_module import SpeechToTextModule
-from route_parser import extract_routes, format_route_output
+from route_parser import extract_routes, format_route_output, print_delta
 import json
+import logging
 
 
 def print_menu():
@@ -26,16 +27,8 @@ def process_voice():
     stt = SpeechToTextModule()
     
     try:
-        # Record audio
-        audio_data = stt.record_audio()
-        
-        if not audio_data:
-            print("[ERROR] No audio recorded. Please try again.")
-            return
-        
-        # Transcribe audio
-        print("\n[PROCESSING] Transcribing audio...")
-        transcribed_text = stt.transcribe_audio(audio_data)
+        # Record audio, transcribing it as it is captured
+        transcribed_text = stt.record_and_transcribe()
         
         if not transcribed_text:
             print("[ERROR] Could not transcribe audio.")
@@ -45,7 +38,8 @@ def process_voice():
         
         # Extract routes
         print("\n[EXTRACTING] Route information...")
-        route_data = extract_routes(transcribed_text)
+        # Show the corrected transcription as it streams in
+        route_data = extract_routes(transcribed_text, on_delta=print_delta)
         
         if route_data and route_data.get('error'):
             print(f"[ERROR] {route_data.get('error')}")
@@ -76,7 +70,8 @@ def test_sample_text():
             test_text = sample_texts[choice - 1]
             print(f"\n[TESTING] Text: {test_text}")
             print("\n[EXTRACTING] Route information...")
-            route_data = extract_routes(test_text)
+            # Show the corrected transcription as it streams in
+            route_data = extract_routes(test_text, on_delta=print_delta)
             
             if route_data and route_data.get('error'):
                 print(f"[ERROR] {route_data.get('error')}")
@@ -104,7 +99,8 @@ def custom_text_input():
         return
     
     print(f"\n[PROCESSING] Text: {user_text}")
-    route_data = extract_routes(user_text)
+    # Show the corrected transcription as it streams in
+    route_data = extract_routes(user_text, on_delta=print_delta)
     
     if route_data and route_data.get('error'):
         print(f"[ERROR] {route_data.get('error')}")
@@ -117,6 +113,10 @@ def custom_text_input():
 
 def main():
     """Main CLI loop"""
+    # Show route extraction progress in the terminal
+    logging.basicConfig(format='%(message)s')
+    logging.getLogger('route_parser').setLevel(logging.INFO)
+    
     print("\nVoice Route Module - CLI Mode")
     print("Ready for testing...")
     
@@ -5,22 +5,87 @@ Handles parsing and structuring route instructions
 
 import os
 import re
+import logging
+import json
+import asyncio
+import copy
+import hashlib
+import string
+import importlib.util
+from collections import OrderedDict
+from functools import lru_cache
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import (
+    OpenAI, AsyncOpenAI, RateLimitError, APITimeoutError, Timeout,
+    DefaultHttpxClient, DefaultAsyncHttpxClient
+)
 
-# Load environment variables from .env file
+try:
+    from flashtext import KeywordProcessor
+except ImportError:
+    KeywordProcessor = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+# Diagnostics go through logging; the CLI enables INFO output, library use stays quiet
+log = logging.getLogger(__name__)
+
+# Load environment variables from .env file (variables already set in the environment win)
 load_dotenv()
 
-# Initialize OpenAI client with API key from environment
-api_key = os.getenv('OPENAI_API_KEY')
+# OpenAI clients are created on first use so importing this module for
+# formatting or abbreviation expansion does not require an API key
+_client = None
+_async_client = None
+_async_client_loop = None
 
-if not api_key:
-    raise ValueError(
-        "OPENAI_API_KEY environment variable not set.\n"
-        "Please set your OpenAI API key before running this module."
-    )
+# Connection pool shared by all requests of a client, so TLS sessions are reused
+# across batches; HTTP/2 multiplexes concurrent requests when h2 is installed.
+# Pools are built with the SDK's own httpx factory and keep its default limits.
+HTTP_TIMEOUT = Timeout(30.0, connect=5.0)
+HTTP2_ENABLED = importlib.util.find_spec('h2') is not None
 
-client = OpenAI(api_key=api_key)
+# Batching limits: transcriptions per request and output budget per transcription
+# The budget scales with input length (see _max_tokens_for) within these bounds
+MAX_BATCH_SIZE = 8
+MIN_TOKENS_PER_ROUTE = 200
+MAX_TOKENS_PER_ROUTE = 800
+# Per-model completion limits; a batch budget is capped at its model's limit
+MODEL_MAX_OUTPUT_TOKENS = {'gpt-4o-mini': 16384, 'gpt-4o': 16384, 'gpt-3.5-turbo': 4096}
+DEFAULT_MAX_OUTPUT_TOKENS = 4096
+
+# Concurrency and retry limits for the async extraction path
+MAX_CONCURRENT_REQUESTS = 16
+MAX_RETRIES = 3
+RETRY_BASE_DELAY_SECONDS = 1.0
+
+# Model tiers, cheapest first: results failing validation escalate to the next tier
+ROUTE_MODELS = ('gpt-4o-mini', 'gpt-4o')
+ROUTE_TEMPERATURE = 0.3  # Slightly higher temperature to avoid repetition bias
+# Used only for transcriptions that no tier could answer (e.g. models unavailable)
+FALLBACK_MODEL = 'gpt-3.5-turbo'
+FALLBACK_TEMPERATURE = 0.2
+
+# In-process LRU cache of parsed OpenAI results, keyed by normalized transcription hash
+# Set ROUTE_PARSER_NO_CACHE=1 to always call OpenAI
+ROUTE_CACHE_MAXSIZE = 1024
+_route_cache = OrderedDict()
+
+# Persistent cache shared across runs (if diskcache is installed), opened on first use
+# No-route responses expire sooner so a misheard transcription is not stuck for a month
+ROUTE_CACHE_DIR = os.getenv('ROUTE_PARSER_CACHE_DIR', os.path.expanduser('~/.cache/route_parser'))
+ROUTE_CACHE_TTL_SECONDS = 30 * 86400
+ROUTE_CACHE_ERROR_TTL_SECONDS = 3600
+_disk_cache = None
+_disk_cache_failed = False
 
 # State Abbreviations to Full Names Mapping
 STATE_ABBREVIATIONS = {
@@ -92,203 +157,967 @@ BASIC_DIRECTIONS = {
     'W': 'West'
 }
 
-# System prompt for route extraction with advanced prompt engineering
+# State and route direction abbreviations share one lookup table (the keys don't overlap)
+_ABBREVIATIONS = {**STATE_ABBREVIATIONS, **DIRECTION_ABBREVIATIONS}
+
+# Abbreviation patterns compiled once, uppercase only: they are matched against an
+# uppercased copy of the text, so the regex engine never has to case-fold
+# Match abbreviations as standalone words (not part of a larger word)
+_ABBREVIATION_RE = re.compile(r'\b(' + '|'.join(_ABBREVIATIONS) + r')\b')
+# Single direction letters only when followed by whitespace, a comma, or end of text
+_BASIC_DIRECTION_RE = re.compile(r'\b(' + '|'.join(BASIC_DIRECTIONS) + r')(?=\s|,|$)')
+
+# ASCII-only uppercasing keeps string length (and so match spans) identical to the original
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+# Single-pass keyword matcher for state and route direction abbreviations (if flashtext is installed)
+if KeywordProcessor is not None:
+    _ABBREVIATION_PROCESSOR = KeywordProcessor(case_sensitive=False)
+    for abbr, full_name in _ABBREVIATIONS.items():
+        _ABBREVIATION_PROCESSOR.add_keyword(abbr, full_name)
+else:
+    _ABBREVIATION_PROCESSOR = None
+
+# Common STT mishearings of route vocabulary, corrected locally before calling OpenAI
+# (matched case-insensitively as whole words/phrases, longest match first)
+STT_CORRECTIONS = {
+    # Directions
+    'south bound': 'SB',
+    'north bound': 'NB',
+    'east bound': 'EB',
+    'west bound': 'WB',
+    's b': 'SB',
+    'n b': 'NB',
+    'e b': 'EB',
+    'w b': 'WB',
+    # Cities and locations
+    'lyon': 'LYON',
+    'rock rapids': 'ROCK RAPIDS',
+    'san born': 'SANBORN',
+    'san boom': 'SANBORN',
+    'sanborn': 'SANBORN',
+    'emmetsburg': 'EMMETSBURG',
+    'emmets burg': 'EMMETSBURG',
+    'emmetts burg': 'EMMETSBURG',
+    'hancock': 'HANCOCK',
+    # Streets
+    'n union': 'N UNION',
+    'eastern': 'EASTERN',
+    'quail': 'QUAIL',
+    'coil av': 'QUAIL AVE',
+    'coil ave': 'QUAIL AVE',
+    # Markers
+    'mile post': 'MILEPOST',
+    'milepost': 'MILEPOST',
+    'intersection': 'INTERSECTION',
+}
+
+# Mishearings that are also ordinary words ("Easter"), corrected only in street
+# name position, i.e. when followed by a street suffix
+_STREET_NAME_CORRECTIONS = {
+    'any union': 'N UNION',
+    'easter': 'EASTERN',
+    'quale': 'QUAIL',
+}
+_STREET_NAME_CORRECTION_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(heard) for heard in _STREET_NAME_CORRECTIONS) + r')'
+    r'(?=\s+(?:ST|STREET|AVE?|AVENUE|RD|ROAD|DR|DRIVE|BLVD|LN|LANE)\b)',
+    re.IGNORECASE | re.ASCII
+)
+
+# "lien" is a mishearing of LYON only in place name position: after AT/IN/NEAR,
+# INTERSECTION or "(", or before INTERSECTION, COUNTY, ")" or a state name
+_PLACE_NAME_CORRECTIONS = {'lien': 'LYON'}
+_PLACE_NAME_CORRECTION_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(heard) for heard in _PLACE_NAME_CORRECTIONS) + r')\b',
+    re.IGNORECASE | re.ASCII
+)
+_PLACE_CONTEXT_BEFORE_RE = re.compile(r'(?:\b(?:AT|IN|NEAR|INTERSECTION)|\()\s*$', re.IGNORECASE)
+_PLACE_CONTEXT_AFTER_RE = re.compile(
+    r'\s*(?:\)|,?\s*(?:INTERSECTION|COUNTY|STATE|'
+    + '|'.join(sorted(STATE_ABBREVIATIONS.values(), key=len, reverse=True)) + r')\b)',
+    re.IGNORECASE
+)
+
+# Route numbers: "I 29"/"eye 29" -> "I-29", "you ess 75" -> "US-75", "I A 4"/"ia 9" -> "IA-4"/"IA-9",
+# "in 9" -> "IA-9"
+_ROUTE_NUMBER_PREFIXES = {'EYE': 'I', 'YOUESS': 'US', 'IA': 'IA', 'IN': 'IA', 'US': 'US', 'I': 'I'}
+_ROUTE_NUMBER_RE = re.compile(
+    r'\b(I ?A|U ?S|YOU ESS|EYE|IN|I|SD|MN|WI|IL|NE|MO)[ -]?(\d+)\b',
+    re.IGNORECASE
+)
+# "169"/"one six nine" -> "US-69" (a bare number, not already part of a route like US-169)
+_US_69_RE = re.compile(r'(?<![\w-])(169|ONE SIX NINE)\b', re.IGNORECASE)
+_US_69_PREFIX_BEFORE_RE = re.compile(r'\b(?:HWY|HIGHWAY|ROUTE|INTERSTATE)\s*$', re.IGNORECASE)
+# County roads: "B 62"/"bee 62"/"B-62" -> "B62", "A 10"/"ay 10" -> "A10"
+_COUNTY_ROAD_PREFIXES = {'AY': 'A', 'BEE': 'B', 'A': 'A', 'B': 'B'}
+_COUNTY_ROAD_RE = re.compile(r'\b(AY|BEE|A|B)[ -](\d+)\b', re.IGNORECASE)
+
+# Prefixes that are also ordinary words ("I 2 think", "a 10 minute break") are only
+# rewritten in road context: after ON/ONTO/VIA/AT or a comma, or before a direction
+# or INTERSECTION. Anything else is left for the model to judge.
+_AMBIGUOUS_ROUTE_PREFIXES = {'I', 'EYE', 'US', 'A', 'AY', 'B', 'BEE'}
+# "in 9" is too common in ordinary speech ("in 9 miles, at ...") to trust a preceding
+# comma or AT, so it is only rewritten before a direction or INTERSECTION
+_FOLLOWING_CONTEXT_ROUTE_PREFIXES = {'IN'}
+_ROAD_CONTEXT_BEFORE_RE = re.compile(r'(?:\b(?:ON|ONTO|VIA|AT)|,)\s*$', re.IGNORECASE)
+_ROAD_CONTEXT_AFTER_RE = re.compile(
+    r'\s*(?:[NSEW]B|(?:NORTH|SOUTH|EAST|WEST)(?: ?BOUND)?|INTERSECTION)\b',
+    re.IGNORECASE
+)
+
+if KeywordProcessor is not None:
+    _STT_CORRECTION_PROCESSOR = KeywordProcessor(case_sensitive=False)
+    for heard, corrected in STT_CORRECTIONS.items():
+        _STT_CORRECTION_PROCESSOR.add_keyword(heard, corrected)
+else:
+    _STT_CORRECTION_PROCESSOR = None
+# Regex equivalent, used without flashtext and for text flashtext cannot handle
+# (ASCII-only case folding, so every match lowercases to a table key)
+_STT_CORRECTION_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(heard) for heard in sorted(STT_CORRECTIONS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE | re.ASCII
+)
+
+# Pre-flight check for anything resembling a route: route numbers with a real route
+# prefix (I-29, US 75, IA-9, SD 11) or a county road letter (B62), direction tokens
+# (EB, south bound), or route keywords. Bare "at 5"/"in 10" do not count. Text without any of these
+# is rejected locally instead of spending an OpenAI call on it.
+_ROUTE_MARKER_RE = re.compile(
+    r'\b(?:I|US|IA|SD|MN|NE|WI|IL|MO)[- ]?\d+\b'
+    r'|\b[A-HJ-NPR-TVX]-?\d+\b'
+    r'|\b[NSEW]B\b'
+    r'|\b(?:NORTH|SOUTH|EAST|WEST) ?BOUND\b'
+    r'|\b(?:INTERSECTION|MILEPOST|MILE POST|HIGHWAY|HWY|INTERSTATE|ROUTE)\b',
+    re.IGNORECASE
+)
+
+# System prompt for route extraction. Deterministic STT corrections are applied
+# before the request (see apply_stt_corrections), so this only covers formatting
+# and the response schema.
 ROUTE_EXTRACTION_PROMPT = """
-You are an expert US route instruction parser and advanced speech-to-text error corrector. Your task is to:
-1. Aggressively correct ALL STT errors in transcribed route instructions
-2. Properly format route data with correct punctuation and capitalization
-3. Extract and structure route information accurately with FULL start and end locations
-4. CRITICALLY: Detect when the input contains NO actual route instructions and return an error response
-
-CRITICAL CONTEXT:
-- This application is exclusively for USA-based routes and highways
-- You work with US Interstate highways (I-X), US routes (US-X), State highways (XX-X), County roads (B-X)
-- Common US states: Iowa (IA), South Dakota (SD), Minnesota (MN), Wisconsin (WI), Illinois (IL), etc.
-- Cities mentioned are always US cities
-- Route segments MUST include start and end locations with full intersection details
-- Intersections use proper formatting: "AT [LOCATION] INTERSECTION" or "[ROUTE] AT [INTERSECTION]"
-- If the transcribed text contains NO route instructions, road names, or route markers, return an error JSON immediately
-
-AGGRESSIVE STT ERROR CORRECTION - FIX THESE PATTERNS:
-ROUTE NUMBER ERRORS:
-- "I 29" or "eye 29" or "I-29" variations → "I-29"
-- "US 75" or "you ess 75" → "US-75"  
-- "IA 9" or "in 9" or "ia-9" → "IA-9"
-- "B 62" or "bee 62" → "B62"
-- "A 10" or "ay 10" → "A10"
-- Split: "I A 4" or "I A4" → "IA-4"
-- "169" or "one six nine" in context → "US-69"
-
-DIRECTIONAL ERRORS:
-- "S B" or "south bound" → "SB"
-- "N B" or "north bound" → "NB"
-- "E B" or "east bound" → "EB"
-- "W B" or "west bound" → "WB"
-
-CITY/LOCATION ERRORS:
-- "lien" or "lyon" → "LYON"
-- "rock rapids" → "ROCK RAPIDS"
-- "san born" or "san boom" → "SANBORN"
-- "emmetsburg" or variations → "EMMETSBURG"
-- "hancock" → "HANCOCK"
-
-STREET/LOCATION ERRORS:
-- "any union" or "n union" → "N UNION ST" or "UNION STREET"
-- "easter" or "eastern" → "EASTERN"
-- "quail" or "quale" → "QUAIL"
-
-MARKER ERRORS:
-- "mile post" or "MP" variations → "MILEPOST" or "MP"
-- "intersection" variations → "INTERSECTION"
-
-- State abbreviations in parentheses like "(LYON)" → "(LYON)"
-
-FORMATTING RULES:
-- Use proper punctuation: commas between segments, parentheses for cities/states
-- Format: "START ON [ROUTE] AT [INTERSECTION] ([CITY])([STATE]), [ROUTE], [ROUTE]..."
-- Always include state abbreviations (SD, IA, MN, etc.)
-- Capitalize cities and state names
-- Use hyphens in route numbers: IA-9, US-75, B62
-
-EXTRACTION TASK:
-From the corrected transcription, extract:
-1. Start location/intersection with city and state
-2. End location/intersection with city and state
-3. Route segments in sequential order WITH the start and end locations included as the first and last items
-
-RESPONSE FORMAT - YOU MUST RETURN VALID JSON ONLY:
-You must respond with ONLY a valid JSON object with no markdown, code blocks, or additional text. The JSON must be on a single line or properly formatted.
-
-If input contains NO route data, return:
-{"error": "No route instructions detected in transcription", "has_routes": false, "input_was": "exact transcribed text here"}
-
-Example valid response for route data:
-{"start_location": "IA-9 EB AT A10 INTERSECTION (LYON), South Dakota", "end_location": "B62 AT QUAIL AVE INTERSECTION (HANCOCK), South Dakota", "route_segments": ["IA-9 EB AT A10 INTERSECTION (LYON)", "US-75 SB", "IA-9 EB (in Rock Rapids at N Union St)", "US-59 SB", "US-18 EB (in Sanborn at Eastern St)", "IA-4 SB (in Emmetsburg at Broadway)", "IA-3 EB", "US-69 NB", "B62 WB (Hancock)", "B62 AT QUAIL AVE INTERSECTION (HANCOCK)"], "has_routes": true, "corrected_text": "Authorized Route: START ON IA-9 EB AT A10 INTERSECTION (LYON) SOUTH DAKOTA, US-75 SB, IA-9 EB (IN ROCK RAPIDS AT N UNION ST), US-59 SB, US-18 EB (IN SANBORN AT EASTERN ST), IA-4 SB (IN EMMETSBURG AT BROADWAY), IA-3 EB, US-69 NB, B62 WB (HANCOCK), END ON B62 AT QUAIL AVE INTERSECTION (HANCOCK) SOUTH DAKOTA"}
-
-Be precise. Extract EXACTLY what is mentioned. Do not add or assume information.
-Ensure all route numbers have hyphens (IA-9, US-75, B62).
-Ensure all directions are properly formatted (SB, EB, NB, WB).
-Ensure all punctuation is correct and readable.
-Return ONLY valid JSON with no additional text.
+Parse US route instructions from speech-to-text transcriptions (common errors are pre-corrected; fix any left). Extract exactly what is said; never add information.
+Known mishearings, when clearly a route or place: "lien" = LYON, "in 9" = IA-9, "169"/"one six nine" = US-69.
+
+Format: hyphenate route numbers (I-29, US-75, IA-9) except county roads (B62); directions SB/NB/EB/WB; intersections as "[ROUTE] AT [PLACE] INTERSECTION ([CITY])".
+
+Return JSON {"routes": [...]}, one entry per numbered transcription, in order:
+{"start_location": "IA-9 EB AT A10 INTERSECTION (LYON), South Dakota", "end_location": "B62 AT QUAIL AVE INTERSECTION (HANCOCK), Iowa", "route_segments": ["IA-9 EB AT A10 INTERSECTION (LYON)", "US-75 SB", "B62 AT QUAIL AVE INTERSECTION (HANCOCK)"], "has_routes": true, "corrected_text": "START ON ..., END ON ..."}
+With no route data: {"error": "No route instructions detected in transcription", "has_routes": false, "input_was": "<text>"}
 """
 
+# Fixed opening of every user message; the numbered transcriptions follow it
+BATCH_INSTRUCTION = (
+    "Correct and parse each of the following route instruction transcriptions and return "
+    "a JSON object whose \"routes\" array has one entry per transcription, in the same order."
+)
+
+# OpenAI caches repeated request prefixes automatically. Never format per-call
+# values into ROUTE_EXTRACTION_PROMPT or BATCH_INSTRUCTION, and keep this key
+# stable so requests share the same cache.
+PROMPT_CACHE_KEY = 'route-extraction'
+
+# Mixed into every result cache key so cached results are not reused after the
+# prompt or model tiers change
+_CACHE_NAMESPACE = hashlib.sha1(
+    "\0".join((ROUTE_EXTRACTION_PROMPT, BATCH_INSTRUCTION) + ROUTE_MODELS + (FALLBACK_MODEL,)).encode('utf-8')
+).hexdigest()[:12]
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize to JSON text, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
 
-def extract_routes(transcribed_text):
+
+def _get_api_key():
+    """Read the OpenAI API key from the environment"""
+    api_key = os.getenv('OPENAI_API_KEY')
+
+    if not api_key:
+        raise ValueError(
+            "OPENAI_API_KEY environment variable not set.\n"
+            "Please set your OpenAI API key before running this module."
+        )
+
+    return api_key
+
+
+def _get_client():
+    """Return the shared OpenAI client, creating it on first use"""
+    global _client
+    if _client is None:
+        http_client = DefaultHttpxClient(timeout=HTTP_TIMEOUT, http2=HTTP2_ENABLED)
+        _client = OpenAI(api_key=_get_api_key(), http_client=http_client)
+    return _client
+
+
+def _get_async_client():
     """
-    Use OpenAI to correct STT errors and extract structured route information
+    Return the shared AsyncOpenAI client for the running event loop
+
+    The client's connection pool is bound to the loop it was used on, so a new
+    client is created when called from a different loop (e.g. a later asyncio.run).
+    Call close_async_client() before the loop ends to release its connections.
+    SDK retries are disabled: _request_route_batch_async does its own backoff.
+    """
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        http_client = DefaultAsyncHttpxClient(timeout=HTTP_TIMEOUT, http2=HTTP2_ENABLED)
+        _async_client = AsyncOpenAI(api_key=_get_api_key(), http_client=http_client, max_retries=0)
+        _async_client_loop = loop
+    return _async_client
+
+
+async def close_async_client():
+    """Close the shared AsyncOpenAI client of the running event loop, if any"""
+    global _async_client, _async_client_loop
+    if _async_client is not None and _async_client_loop is asyncio.get_running_loop():
+        client = _async_client
+        _async_client = None
+        _async_client_loop = None
+        await client.close()
+
+
+def _has_route_markers(text):
+    """Check whether a transcription could contain route instructions"""
+    return bool(text) and _ROUTE_MARKER_RE.search(text) is not None
+
+
+def _no_routes_response(text):
+    """Build the same no-routes response the model returns, without calling it"""
+    return {
+        "error": "No route instructions detected in transcription",
+        "has_routes": False,
+        "input_was": text
+    }
+
+
+def _cache_enabled():
+    """Check whether route extraction results may be served from the cache"""
+    return os.getenv('ROUTE_PARSER_NO_CACHE') != '1'
+
+
+def _cache_key(text):
+    """Hash a transcription after normalizing case and whitespace, scoped to the prompt and model version"""
+    normalized_text = " ".join(text.upper().split())
+    return _CACHE_NAMESPACE + ':' + hashlib.sha1(normalized_text.encode('utf-8')).hexdigest()
+
+
+def _get_disk_cache():
+    """Return the shared on-disk cache, or None if diskcache is unavailable"""
+    global _disk_cache, _disk_cache_failed
+    if _disk_cache is None and Cache is not None and not _disk_cache_failed:
+        try:
+            _disk_cache = Cache(ROUTE_CACHE_DIR)
+        except Exception as e:
+            log.warning("[WARNING] Disk cache unavailable, using in-memory cache only: %s", e)
+            _disk_cache_failed = True
+    return _disk_cache
+
+
+def _remember(key, serialized):
+    """Insert a serialized result into the in-process LRU"""
+    _route_cache[key] = serialized
+    _route_cache.move_to_end(key)
+    if len(_route_cache) > ROUTE_CACHE_MAXSIZE:
+        _route_cache.popitem(last=False)
+
+
+def _cache_get(text):
+    """Return a fresh copy of the cached OpenAI result for a transcription, or None"""
+    if not _cache_enabled():
+        return None
+
+    key = _cache_key(text)
+    cached = _route_cache.get(key)
+    if cached is not None:
+        _route_cache.move_to_end(key)
+        return _json_loads(cached)
+
+    disk_cache = _get_disk_cache()
+    if disk_cache is None:
+        return None
+
+    try:
+        cached = disk_cache.get(key)
+    except Exception as e:
+        log.warning("[WARNING] Disk cache read failed, using in-memory cache only: %s", e)
+        return None
+    if cached is None:
+        return None
+
+    _remember(key, cached)
+    return _json_loads(cached)
+
+
+def _cache_put(text, route_data):
+    """Store an OpenAI result, serialized so callers cannot mutate the cached copy"""
+    if not _cache_enabled() or not isinstance(route_data, dict):
+        return
+
+    key = _cache_key(text)
+    serialized = _json_dumps(route_data)
+    _remember(key, serialized)
+
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        expire = ROUTE_CACHE_ERROR_TTL_SECONDS if route_data.get('error') else ROUTE_CACHE_TTL_SECONDS
+        try:
+            disk_cache.set(key, serialized, expire=expire)
+        except Exception as e:
+            log.warning("[WARNING] Disk cache write failed, result kept in memory only: %s", e)
+
+
+def _keyword_processor_safe(text):
+    """
+    Check that flashtext can process text: it walks the lowercased text with
+    indices into the original, so lowercasing must not change the length
+    (e.g. "İ" lowercases to two characters)
+    """
+    return len(text.lower()) == len(text)
+
+
+def apply_stt_corrections(text):
+    """
+    Correct common STT mishearings of route vocabulary before sending text to OpenAI
     
     Args:
-        transcribed_text: Raw transcribed text from STT
+        text: Raw transcribed text from STT
         
     Returns:
-        dict: Structured route information with corrections or None if parsing fails
+        str: Text with known mishearings and route number spacing corrected
     """
-    try:
-        print("[ROUTE EXTRACTION] Correcting STT errors and parsing with OpenAI...\n")
-        print(f"[DEBUG] Input text being sent to OpenAI: {transcribed_text}\n")
-        
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "system",
-                    "content": ROUTE_EXTRACTION_PROMPT
-                },
-                {
-                    "role": "user",
-                    "content": f"Correct and parse this route instruction transcription: {transcribed_text}"
-                }
-            ],
-            temperature=0.3,  # Slightly higher temperature to avoid repetition bias
-            max_tokens=800
+    if not text:
+        return text
+    
+    if _STT_CORRECTION_PROCESSOR is not None and _keyword_processor_safe(text):
+        result = _STT_CORRECTION_PROCESSOR.replace_keywords(text)
+    else:
+        result = _STT_CORRECTION_RE.sub(lambda m: STT_CORRECTIONS[m.group(1).lower()], text)
+    
+    result = _STREET_NAME_CORRECTION_RE.sub(
+        lambda m: _STREET_NAME_CORRECTIONS[m.group(1).lower()], result
+    )
+    result = _PLACE_NAME_CORRECTION_RE.sub(_place_name_replacement, result)
+    
+    result = _ROUTE_NUMBER_RE.sub(
+        lambda m: _route_number_replacement(m, f"{_route_prefix(m.group(1))}-{m.group(2)}"),
+        result
+    )
+    result = _COUNTY_ROAD_RE.sub(
+        lambda m: _route_number_replacement(
+            m, f"{_COUNTY_ROAD_PREFIXES[m.group(1).upper()]}{m.group(2)}"
+        ),
+        result
+    )
+    result = _US_69_RE.sub(_us_69_replacement, result)
+    
+    return result
+
+
+def _route_prefix(heard):
+    """Canonical route prefix for a (possibly split or spoken) prefix match"""
+    prefix = heard.upper().replace(' ', '')
+    return _ROUTE_NUMBER_PREFIXES.get(prefix, prefix)
+
+
+def _route_number_replacement(match, replacement):
+    """Replacement for a route number match, or the original text when an ambiguous prefix lacks road context"""
+    prefix = match.group(1).upper().replace(' ', '')
+    if prefix in _FOLLOWING_CONTEXT_ROUTE_PREFIXES:
+        return replacement if _ROAD_CONTEXT_AFTER_RE.match(match.string, match.end()) else match.group(0)
+    if prefix not in _AMBIGUOUS_ROUTE_PREFIXES or _has_road_context(match):
+        return replacement
+    return match.group(0)
+
+
+def _has_road_context(match):
+    """Check for road context around a match: ON/ONTO/VIA/AT or a comma before it, or a direction after it"""
+    return bool(
+        _ROAD_CONTEXT_BEFORE_RE.search(match.string, 0, match.start())
+        or _ROAD_CONTEXT_AFTER_RE.match(match.string, match.end())
+    )
+
+
+def _place_name_replacement(match):
+    """Correct a misheard place name only in place name position"""
+    if (_PLACE_CONTEXT_BEFORE_RE.search(match.string, 0, match.start())
+            or _PLACE_CONTEXT_AFTER_RE.match(match.string, match.end())):
+        return _PLACE_NAME_CORRECTIONS[match.group(1).lower()]
+    return match.group(0)
+
+
+def _us_69_replacement(match):
+    """Rewrite a bare "169" to US-69 in road context, unless it follows a route word (HIGHWAY 169)"""
+    if _US_69_PREFIX_BEFORE_RE.search(match.string, 0, match.start()) or not _has_road_context(match):
+        return match.group(0)
+    return "US-69"
+
+
+def _build_batch_message(texts):
+    """Row-marshal transcriptions into a single numbered user message"""
+    # Fixed instruction first and per-call content last, so the request prefix
+    # stays byte-identical across calls for OpenAI prompt caching
+    lines = [
+        BATCH_INSTRUCTION,
+        f"Transcriptions ({len(texts)}):"
+    ]
+    for i, text in enumerate(texts, 1):
+        lines.append(f"{i}. {text}")
+    return "\n".join(lines)
+
+
+def _max_tokens_for(texts, model):
+    """
+    Output token budget for a batch: about 4x each transcription's estimated
+    token count (corrected text plus segments) plus room for the JSON fields,
+    capped at the model's output limit
+    """
+    total = 0
+    for text in texts:
+        estimated_input_tokens = len(text.split()) * 1.3
+        total += int(min(MAX_TOKENS_PER_ROUTE, max(MIN_TOKENS_PER_ROUTE, 4 * estimated_input_tokens + 128)))
+    return min(total, MODEL_MAX_OUTPUT_TOKENS.get(model, DEFAULT_MAX_OUTPUT_TOKENS))
+
+
+def _build_completion_kwargs(texts, model, temperature):
+    """Build the chat completion arguments for one batch of transcriptions"""
+    return {
+        "model": model,
+        "messages": [
+            {
+                "role": "system",
+                "content": ROUTE_EXTRACTION_PROMPT
+            },
+            {
+                "role": "user",
+                "content": _build_batch_message(texts)
+            }
+        ],
+        "temperature": temperature,
+        "max_tokens": _max_tokens_for(texts, model),
+        "response_format": {"type": "json_object"},
+        # Route every extraction request to the same prompt cache
+        "extra_body": {"prompt_cache_key": PROMPT_CACHE_KEY}
+    }
+
+
+class _CorrectedTextStream:
+    """
+    Incremental scanner over a streamed {"routes": [...]} response that forwards
+    only the decoded "corrected_text" values, as their characters arrive, with a
+    newline after each value
+    """
+
+    def __init__(self, on_delta):
+        self._on_delta = on_delta
+        self._in_string = False
+        self._emitting = False  # inside a corrected_text value
+        self._escape = ''       # pending escape sequence, e.g. '\\u00'
+        self._high_surrogate = ''
+        self._chars = []        # characters of the current non-emitted string
+        self._last_string = None
+        self._key = None        # key whose value comes next
+
+    def feed(self, delta):
+        """Scan one chunk of response text and forward any corrected_text characters"""
+        out = []
+        for char in delta:
+            if not self._in_string:
+                if char == '"':
+                    self._in_string = True
+                    self._emitting = self._key == 'corrected_text'
+                    self._chars = []
+                elif char == ':':
+                    self._key = self._last_string
+                elif char in ',{}[]':
+                    self._key = None
+            elif self._escape:
+                self._escape += char
+                if self._escape[1] != 'u' or len(self._escape) == 6:
+                    self._take(self._decode_escape(), out)
+            elif char == '\\':
+                self._escape = char
+            elif char == '"':
+                self._in_string = False
+                if self._emitting:
+                    out.append('\n')
+                    self._emitting = False
+                    self._key = None
+                else:
+                    self._last_string = ''.join(self._chars)
+            else:
+                self._take(char, out)
+        if out:
+            self._on_delta(''.join(out))
+
+    def _decode_escape(self):
+        """Decode the pending escape sequence, pairing UTF-16 surrogates"""
+        sequence, self._escape = self._escape, ''
+        try:
+            char = json.loads('"' + self._high_surrogate + sequence + '"')
+        except ValueError:
+            char = ''
+        self._high_surrogate = ''
+        if len(char) == 1 and '\ud800' <= char <= '\udbff':
+            # First half of a surrogate pair: wait for the second escape
+            self._high_surrogate = sequence
+            return ''
+        return char
+
+    def _take(self, text, out):
+        """Route decoded string content to the output or the current string buffer"""
+        if self._emitting:
+            out.append(text)
+        else:
+            self._chars.append(text)
+
+
+def _request_route_batch(texts, model, temperature, on_delta=None):
+    """
+    Send one streamed chat completion request covering every transcription in the batch
+
+    Args:
+        texts: Transcriptions in the batch
+        model: OpenAI model name
+        temperature: Sampling temperature
+        on_delta: Optional callback receiving each result's corrected_text as it arrives
+
+    Returns:
+        str: The complete response text
+    """
+    stream = _get_client().chat.completions.create(
+        **_build_completion_kwargs(texts, model, temperature),
+        stream=True
+    )
+
+    text_stream = _CorrectedTextStream(on_delta) if on_delta is not None else None
+    parts = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            if text_stream is not None:
+                text_stream.feed(delta)
+    return "".join(parts)
+
+
+async def _request_route_batch_async(texts, model, temperature):
+    """
+    Async variant of _request_route_batch, retrying rate limits and timeouts
+    with exponential backoff
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = await _get_async_client().chat.completions.create(
+                **_build_completion_kwargs(texts, model, temperature)
+            )
+            return response.choices[0].message.content
+        except (RateLimitError, APITimeoutError) as e:
+            # insufficient_quota is reported as a 429 but will never succeed on retry
+            if attempt == MAX_RETRIES or 'insufficient_quota' in str(e).lower():
+                raise
+            delay = RETRY_BASE_DELAY_SECONDS * (2 ** attempt)
+            log.warning("[RETRY] %s, retrying in %.1fs...", type(e).__name__, delay)
+            await asyncio.sleep(delay)
+
+
+def _parse_batch_response(response_text, expected_count):
+    """
+    Parse the model's {"routes": [...]} object into one result per transcription
+
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON (orjson's error subclasses it)
+        ValueError: If the routes array length does not match the batch size
+    """
+    parsed = _json_loads(response_text)
+    if isinstance(parsed, dict) and isinstance(parsed.get('routes'), list):
+        parsed = parsed['routes']
+    elif isinstance(parsed, dict):
+        # A single transcription may come back as a bare route object
+        parsed = [parsed]
+    if not isinstance(parsed, list) or len(parsed) != expected_count:
+        raise ValueError(
+            f"Expected {expected_count} route results, got: {response_text[:200]}"
         )
-        
-        response_text = response.choices[0].message.content
-        print(f"[DEBUG] Raw OpenAI response: {response_text}\n")
-        print("[ROUTE EXTRACTION] Complete\n")
-        
-        # Check if response is empty
-        if not response_text or response_text.strip() == '':
-            print("[ERROR] OpenAI returned empty response\n")
-            print("[INFO] Possible causes:\n")
-            print("  - API key expired or invalid\n")
-            print("  - Account out of credits\n")
-            print("  - Model 'gpt-4o' not available\n")
-            return None
-        
-        # Parse JSON response
-        import json
+    return parsed
+
+
+def _finalize_batch(texts, results):
+    """Cache the parsed results for a batch and finalize them for callers"""
+    for text, route_data in zip(texts, results):
+        # Provisional answers that failed validation are returned but not cached
+        if _is_valid_route_data(route_data) or (isinstance(route_data, dict) and route_data.get('error')):
+            _cache_put(text, route_data)
+    return [_finalize_route_data(route_data) for route_data in results]
+
+
+def _finalize_route_data(route_data):
+    """Convert one parsed result into the value returned to callers"""
+    if route_data is None:
+        # Request or parse failure, already reported
+        return None
+
+    if not isinstance(route_data, dict):
+        log.error("[ERROR] Unexpected result from OpenAI: %s", route_data)
+        return None
+
+    # Check if OpenAI detected no routes
+    if route_data.get('error'):
+        log.warning("[WARNING] %s", route_data.get('error'))
+        return None
+
+    # Display corrected text for verification
+    if route_data.get('corrected_text'):
+        log.info("[INFO] Corrected transcription:\n%s", route_data.get('corrected_text'))
+
+    return route_data
+
+
+def _parse_model_response(response_text, expected_count, model):
+    """
+    Parse the raw model output for one batch
+
+    Returns:
+        list: One parsed result per transcription, or None if the response was unusable
+    """
+    log.debug("[DEBUG] Raw OpenAI response (%s): %s", model, response_text)
+    log.info("[ROUTE EXTRACTION] Complete")
+
+    # Check if response is empty
+    if not response_text or response_text.strip() == '':
+        log.error(
+            "[ERROR] OpenAI returned empty response\n"
+            "[INFO] Possible causes:\n"
+            "  - API key expired or invalid\n"
+            "  - Account out of credits\n"
+            "  - Model '%s' not available",
+            model
+        )
+        return None
+
+    # Parse JSON response
+    try:
+        return _parse_batch_response(response_text, expected_count)
+    except (json.JSONDecodeError, ValueError) as je:
+        log.error("[ERROR] Invalid JSON from OpenAI: %s", je)
+        log.debug("[DEBUG] Response was: %s", response_text[:200])
+        return None
+
+
+def _is_valid_route_data(route_data):
+    """Check that a result has start/end locations and non-empty, route-like segments"""
+    if not isinstance(route_data, dict) or route_data.get('error'):
+        return False
+    if not route_data.get('start_location') or not route_data.get('end_location'):
+        return False
+
+    segments = route_data.get('route_segments')
+    if not isinstance(segments, list) or not segments:
+        return False
+    return all(isinstance(segment, str) and _has_route_markers(segment) for segment in segments)
+
+
+def _is_no_routes_response(route_data):
+    """Check for a well-formed answer that the transcription contains no routes"""
+    return (
+        isinstance(route_data, dict)
+        and bool(route_data.get('error'))
+        and route_data.get('has_routes') is False
+    )
+
+
+def _accept_tier_results(parsed, pending, results, accept_all):
+    """
+    Record one tier's results and return the indices that should be escalated
+
+    Results failing validation are kept as provisional answers in case every
+    later tier fails, unless accept_all is set for the final tier. A well-formed
+    "no routes" answer is final and is not escalated.
+    """
+    escalate = []
+    for i, route_data in zip(pending, parsed):
+        results[i] = route_data
+        if accept_all or _is_valid_route_data(route_data) or _is_no_routes_response(route_data):
+            continue
+        escalate.append(i)
+    return escalate
+
+
+def _report_extraction_error(error, model):
+    """
+    Print diagnostics for a failed extraction request
+
+    Returns:
+        bool: True if another model may still succeed, False for account-level failures
+    """
+    error_msg = str(error)
+    log.error("[ERROR] Route extraction failed (%s): %s", model, error_msg)
+
+    # Check for specific API errors
+    if 'invalid_api_key' in error_msg.lower():
+        log.critical("[CRITICAL] Invalid or expired OpenAI API key")
+        return False
+    elif 'insufficient_quota' in error_msg.lower():
+        log.critical("[CRITICAL] OpenAI account has insufficient quota (out of credits)")
+        return False
+    elif 'model_not_found' in error_msg.lower():
+        log.info("[INFO] Model '%s' not available", model)
+
+    return True
+
+
+def _extract_route_chunk(texts, on_delta=None):
+    """
+    Extract routes for up to MAX_BATCH_SIZE transcriptions, one OpenAI call per model tier
+
+    Every transcription is first sent to the cheapest model in ROUTE_MODELS;
+    only results that fail validation are re-sent to the next tier. The
+    FALLBACK_MODEL is used for transcriptions that no tier could answer.
+
+    Every request streams its corrected_text values to on_delta live; when
+    results are re-sent to another model, a separator line naming it comes first.
+
+    Returns:
+        list: One route dict (or None if parsing failed) per transcription
+    """
+    log.info("[ROUTE EXTRACTION] Correcting STT errors and parsing %d transcription(s) with OpenAI...", len(texts))
+    log.debug("[DEBUG] Input text being sent to OpenAI: %s", texts)
+
+    results = [None] * len(texts)
+    pending = list(range(len(texts)))
+
+    for tier, model in enumerate(ROUTE_MODELS):
+        batch = [texts[i] for i in pending]
+        final_tier = tier == len(ROUTE_MODELS) - 1
+        if tier > 0 and on_delta is not None:
+            on_delta(f"--- {model} ---\n")
         try:
-            route_data = json.loads(response_text)
-        except json.JSONDecodeError as je:
-            print(f"[ERROR] Invalid JSON from OpenAI: {str(je)}\n")
-            print(f"[DEBUG] Response was: {response_text[:200]}\n")
-            return None
-        
-        # Check if OpenAI detected no routes
-        if route_data.get('error'):
-            print(f"[WARNING] {route_data.get('error')}\n")
-            return None
-        
-        # Display corrected text for verification
-        if route_data.get('corrected_text'):
-            print("[INFO] Corrected transcription:")
-            print(f"{route_data.get('corrected_text')}\n")
-        
-        return route_data
-        
+            response_text = _request_route_batch(batch, model, ROUTE_TEMPERATURE, on_delta)
+        except Exception as e:
+            if not _report_extraction_error(e, model):
+                return [None] * len(texts)
+            continue
+
+        parsed = _parse_model_response(response_text, len(batch), model)
+        if parsed is not None:
+            pending = _accept_tier_results(parsed, pending, results, final_tier)
+        if not pending:
+            break
+        if tier < len(ROUTE_MODELS) - 1:
+            log.info("[INFO] Escalating %d transcription(s) to %s...", len(pending), ROUTE_MODELS[tier + 1])
+
+    missing = [i for i, route_data in enumerate(results) if route_data is None]
+    if missing:
+        if on_delta is not None:
+            on_delta(f"--- {FALLBACK_MODEL} ---\n")
+        parsed = _extract_route_chunk_fallback([texts[i] for i in missing], on_delta)
+        _accept_tier_results(parsed, missing, results, accept_all=True)
+
+    return _finalize_batch(texts, results)
+
+
+def _extract_route_chunk_fallback(texts, on_delta=None):
+    """
+    Fallback to FALLBACK_MODEL when no model tier produced a result
+
+    Returns:
+        list: One parsed (not yet finalized) result per transcription, None on failure
+    """
+    try:
+        log.info("[FALLBACK] Using %s...", FALLBACK_MODEL)
+
+        response_text = _request_route_batch(texts, FALLBACK_MODEL, FALLBACK_TEMPERATURE, on_delta)
+        return _parse_batch_response(response_text, len(texts))
+
     except Exception as e:
-        error_msg = str(e)
-        print(f"[ERROR] Route extraction failed: {error_msg}\n")
-        
-        # Check for specific API errors
-        if 'invalid_api_key' in error_msg.lower():
-            print("[CRITICAL] Invalid or expired OpenAI API key\n")
-        elif 'insufficient_quota' in error_msg.lower():
-            print("[CRITICAL] OpenAI account has insufficient quota (out of credits)\n")
-        elif 'model_not_found' in error_msg.lower():
-            print("[INFO] GPT-4o model not available. Trying GPT-3.5-turbo...\n")
-            return extract_routes_fallback(transcribed_text)
+        log.error("[ERROR] Fallback also failed: %s", e)
+        return [None] * len(texts)
+
+
+async def _extract_route_chunk_async(texts):
+    """Async variant of _extract_route_chunk, including the model tiers and fallback"""
+    log.info("[ROUTE EXTRACTION] Correcting STT errors and parsing %d transcription(s) with OpenAI...", len(texts))
+
+    results = [None] * len(texts)
+    pending = list(range(len(texts)))
+
+    for tier, model in enumerate(ROUTE_MODELS):
+        batch = [texts[i] for i in pending]
+        try:
+            response_text = await _request_route_batch_async(batch, model, ROUTE_TEMPERATURE)
+        except Exception as e:
+            if not _report_extraction_error(e, model):
+                return [None] * len(texts)
+            continue
+
+        parsed = _parse_model_response(response_text, len(batch), model)
+        if parsed is not None:
+            pending = _accept_tier_results(parsed, pending, results, tier == len(ROUTE_MODELS) - 1)
+        if not pending:
+            break
+
+    missing = [i for i, route_data in enumerate(results) if route_data is None]
+    if missing:
+        try:
+            log.info("[FALLBACK] Using %s...", FALLBACK_MODEL)
+
+            batch = [texts[i] for i in missing]
+            response_text = await _request_route_batch_async(batch, FALLBACK_MODEL, FALLBACK_TEMPERATURE)
+            parsed = _parse_batch_response(response_text, len(batch))
+            _accept_tier_results(parsed, missing, results, accept_all=True)
+
+        except Exception as e:
+            log.error("[ERROR] Fallback also failed: %s", e)
+
+    return _finalize_batch(texts, results)
+
+
+def extract_routes_batch(texts, on_delta=None):
+    """
+    Use OpenAI to correct STT errors and extract structured route information
+    for several transcriptions, sharing one request (and one system prompt
+    prefill) per chunk of up to MAX_BATCH_SIZE transcriptions
+
+    Known STT mishearings are corrected locally first. Transcriptions without any
+    route markers are then rejected locally, transcriptions already seen (ignoring
+    case and whitespace) are served from the cache, and duplicates within the
+    batch are only sent once.
+
+    Args:
+        texts: List of raw transcribed texts from STT
+        on_delta: Optional callback receiving the corrected transcription text as it streams in
+
+    Returns:
+        list: Route dicts in input order, None for entries that failed to parse
+    """
+    results = [None] * len(texts)
+    pending = OrderedDict()  # cache key -> indices of texts awaiting OpenAI
+
+    # Correct once up front so spoken variants ("san boom", "sanborn") share cache entries
+    corrected_texts = [apply_stt_corrections(text) for text in texts]
+
+    for i, text in enumerate(corrected_texts):
+        if not _has_route_markers(text):
+            results[i] = _finalize_route_data(_no_routes_response(texts[i]))
+            continue
+
+        cached = _cache_get(text)
+        if cached is not None:
+            log.info("[CACHE] Using cached route extraction")
+            results[i] = _finalize_route_data(cached)
+        else:
+            pending.setdefault(_cache_key(text), []).append(i)
+
+    groups = list(pending.values())
+    for start in range(0, len(groups), MAX_BATCH_SIZE):
+        chunk = groups[start:start + MAX_BATCH_SIZE]
+        chunk_results = _extract_route_chunk([corrected_texts[indices[0]] for indices in chunk], on_delta)
+        for indices, route_data in zip(chunk, chunk_results):
+            # Repeated transcriptions share one request but each gets its own copy
+            results[indices[0]] = route_data
+            for i in indices[1:]:
+                results[i] = copy.deepcopy(route_data)
+
+    return results
+
+
+def extract_routes(transcribed_text, on_delta=None):
+    """
+    Use OpenAI to correct STT errors and extract structured route information
+    
+    Args:
+        transcribed_text: Raw transcribed text from STT
+        on_delta: Optional callback receiving the corrected transcription text as it streams in
         
-        return None
+    Returns:
+        dict: Structured route information with corrections or None if parsing fails
+    """
+    return extract_routes_batch([transcribed_text], on_delta)[0]
 
 
 def extract_routes_fallback(transcribed_text):
     """
-    Fallback to GPT-3.5-turbo if GPT-4o is not available
+    Extract routes with FALLBACK_MODEL (GPT-3.5-turbo) directly
     """
-    try:
-        print("[FALLBACK] Using GPT-3.5-turbo...\n")
-        
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {
-                    "role": "system",
-                    "content": ROUTE_EXTRACTION_PROMPT
-                },
-                {
-                    "role": "user",
-                    "content": f"Correct and parse this route instruction transcription: {transcribed_text}"
-                }
-            ],
-            temperature=0.2,
-            max_tokens=800
-        )
-        
-        response_text = response.choices[0].message.content
-        import json
-        route_data = json.loads(response_text)
-        
-        if route_data.get('corrected_text'):
-            print("[INFO] Corrected transcription:")
-            print(f"{route_data.get('corrected_text')}\n")
-        
-        return route_data
-        
-    except Exception as e:
-        print(f"[ERROR] Fallback also failed: {str(e)}\n")
-        return None
+    return _finalize_batch([transcribed_text], _extract_route_chunk_fallback([transcribed_text]))[0]
+
+
+async def extract_routes_async(transcribed_text, semaphore=None):
+    """
+    Async variant of extract_routes
+
+    Args:
+        transcribed_text: Raw transcribed text from STT
+        semaphore: Optional asyncio.Semaphore bounding concurrent OpenAI requests
+
+    Returns:
+        dict: Structured route information with corrections or None if parsing fails
+    """
+    corrected_text = apply_stt_corrections(transcribed_text)
+
+    if not _has_route_markers(corrected_text):
+        return _finalize_route_data(_no_routes_response(transcribed_text))
+
+    cached = _cache_get(corrected_text)
+    if cached is not None:
+        log.info("[CACHE] Using cached route extraction")
+        return _finalize_route_data(cached)
+
+    if semaphore is None:
+        return (await _extract_route_chunk_async([corrected_text]))[0]
+
+    async with semaphore:
+        return (await _extract_route_chunk_async([corrected_text]))[0]
+
+
+async def extract_routes_many_async(texts, concurrency=MAX_CONCURRENT_REQUESTS):
+    """
+    Extract routes for independent transcriptions concurrently, one OpenAI
+    request per transcription with at most `concurrency` requests in flight
+
+    The shared async client stays open for later calls on the same loop; await
+    close_async_client() before the loop ends (extract_routes_many does this).
+
+    Args:
+        texts: List of raw transcribed texts from STT
+        concurrency: Maximum number of simultaneous OpenAI requests
+
+    Returns:
+        list: Route dicts in input order, None for entries that failed to parse
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *(extract_routes_async(text, semaphore) for text in texts)
+    )
+
+
+def extract_routes_many(texts, concurrency=MAX_CONCURRENT_REQUESTS):
+    """Synchronous entry point for extract_routes_many_async"""
+    async def run():
+        try:
+            return await extract_routes_many_async(texts, concurrency)
+        finally:
+            await close_async_client()
+
+    return asyncio.run(run())
+
+
+def print_delta(delta):
+    """on_delta callback that echoes the streamed corrected transcription to the terminal"""
+    print(delta, end="", flush=True)
 
 
 def format_route_output(route_data):
@@ -304,39 +1133,61 @@ def format_route_output(route_data):
     if not route_data:
         return "Unable to parse route information"
     
-    output = "\n" + "🗺️  Route Information:\n"
-    output += "-"*60 + "\n"
+    # Expand abbreviations in locations and segments
+    display_data = {
+        "start_location": expand_abbreviations(route_data.get("start_location", "N/A")),
+        "end_location": expand_abbreviations(route_data.get("end_location", "N/A")),
+        "route_segments": [
+            expand_abbreviations(segment) for segment in route_data.get('route_segments', [])
+        ]
+    }
     
-    # Create JSON-like output with proper formatting
-    output += "{\n"
-    start_loc = route_data.get("start_location", "N/A")
-    end_loc = route_data.get("end_location", "N/A")
+    parts = [
+        "\n🗺️  Route Information:\n",
+        "-"*60, "\n",
+        _json_dumps(display_data, indent=True), "\n"
+    ]
     
-    # Expand abbreviations in locations
-    start_loc_expanded = expand_abbreviations(start_loc)
-    end_loc_expanded = expand_abbreviations(end_loc)
+    return "".join(parts)
+
+
+def _replace_uppercase_matches(pattern, replacements, text):
+    """
+    Case-insensitively replace matches of an uppercase-only pattern
     
-    output += f'  "start_location": "{start_loc_expanded}",\n'
-    output += f'  "end_location": "{end_loc_expanded}",\n'
+    The pattern scans an uppercased copy of the text; the replacements are
+    spliced into the original, so unmatched text keeps its casing.
     
-    output += '  "route_segments": [\n'
-    segments = route_data.get('route_segments', [])
-    for i, segment in enumerate(segments):
-        expanded_segment = expand_abbreviations(segment)
-        if i < len(segments) - 1:
-            output += f'    "{expanded_segment}",\n'
-        else:
-            output += f'    "{expanded_segment}"\n'
-    output += "  ]\n"
-    output += "}\n"
+    Args:
+        pattern: Compiled uppercase pattern whose first group is a key of replacements
+        replacements: Dict mapping uppercase matches to replacement strings
+        text: Original text
+        
+    Returns:
+        str: Text with all matches replaced
+    """
+    parts = []
+    last_end = 0
+    for match in pattern.finditer(text.translate(_ASCII_UPPER)):
+        start, end = match.span()
+        parts.append(text[last_end:start])
+        parts.append(replacements[match.group(1)])
+        last_end = end
     
-    return output
+    if not parts:
+        return text
+    
+    parts.append(text[last_end:])
+    return "".join(parts)
 
 
+@lru_cache(maxsize=4096)
 def expand_abbreviations(text):
     """
     Expand state, direction, and basic direction abbreviations in route text
     
+    Results are memoized, since the same segments (e.g. "US-75 SB") recur across routes.
+    
     Args:
         text: String containing route information with abbreviations
         
@@ -346,25 +1197,14 @@ def expand_abbreviations(text):
     if not text:
         return text
     
-    result = text
-    
-    # Replace state abbreviations (e.g., "IA" -> "Iowa")
-    # Use word boundaries to avoid partial matches
-    for abbr, full_name in STATE_ABBREVIATIONS.items():
-        # Match abbreviation as a standalone word (not part of a larger word)
-        pattern = r'\b' + abbr + r'\b'
-        result = re.sub(pattern, full_name, result, flags=re.IGNORECASE)
-    
-    # Replace direction abbreviations (e.g., "NB" -> "Northbound")
-    for abbr, full_name in DIRECTION_ABBREVIATIONS.items():
-        pattern = r'\b' + abbr + r'\b'
-        result = re.sub(pattern, full_name, result, flags=re.IGNORECASE)
+    if _ABBREVIATION_PROCESSOR is not None and _keyword_processor_safe(text):
+        # Replace state and direction abbreviations in one linear scan
+        result = _ABBREVIATION_PROCESSOR.replace_keywords(text)
+    else:
+        # Replace state and direction abbreviations (e.g., "IA" -> "Iowa", "NB" -> "Northbound")
+        result = _replace_uppercase_matches(_ABBREVIATION_RE, _ABBREVIATIONS, text)
     
     # Replace basic direction abbreviations (e.g., "N" -> "North")
-    # Need to be careful not to match single letters in other contexts
-    for abbr, full_name in BASIC_DIRECTIONS.items():
-        # Match single direction letters that are preceded and followed by spaces or specific characters
-        pattern = r'\b' + abbr + r'(?=\s|,|$)'
-        result = re.sub(pattern, full_name, result, flags=re.IGNORECASE)
+    result = _replace_uppercase_matches(_BASIC_DIRECTION_RE, BASIC_DIRECTIONS, result)
     
     return result